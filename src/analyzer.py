@@ -1,20 +1,51 @@
 """Claude API article analyzer — subject-agnostic."""
 
+import asyncio
+import functools
 import json
 import logging
-import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import Literal
 
 import anthropic
+import httpx
+import orjson
 
-from src.utils import retry_with_backoff
+from src.utils import HTTP2_AVAILABLE, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16)
+
+_client: anthropic.Anthropic | None = None
+
+# Serializes appends to failures.jsonl from parser threads
+_failed_lock = threading.Lock()
+
 # Fields required in each analyzer result
-_REQUIRED_FIELDS = {"decision", "headline"}
+_REQUIRED_FIELDS = frozenset({"decision", "headline"})
+
+# Article fields always sent to Claude, in payload order
+_PAYLOAD_FIELDS = ("title", "snippet", "url", "published", "source")
+_get_payload_fields = itemgetter(*_PAYLOAD_FIELDS)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Batch processing statuses after which polling can stop
+_BATCH_TERMINAL_STATUSES = frozenset({"ended", "canceled", "expired", "failed"})
+
+# Per-request instructions, kept in the cached system prefix so the user
+# message carries nothing but the article payload
+_ANALYSIS_INSTRUCTIONS = (
+    "Analyze every article in the JSON array in the user message. Return a "
+    "JSON array with EXACTLY one object per article — one KEEP or KILL "
+    "decision per article. Do not skip any."
+)
 
 # Default values for optional fields shared across all subjects
 _BASE_OPTIONAL_DEFAULTS = {
@@ -33,26 +64,54 @@ _BASE_OPTIONAL_DEFAULTS = {
 }
 
 
+def _get_client() -> anthropic.Anthropic:
+    """Return the shared sync Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = anthropic.Anthropic(
+            http_client=anthropic.DefaultHttpxClient(
+                http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS,
+            ),
+        )
+    return _client
+
+
+def _new_async_client() -> anthropic.AsyncAnthropic:
+    """Create an async Anthropic client with a pooled HTTP/2 connection.
+
+    Async connections are bound to the event loop that opened them, so each
+    asyncio.run() needs its own client; all batches within a run share it.
+    """
+    return anthropic.AsyncAnthropic(
+        http_client=anthropic.DefaultAsyncHttpxClient(
+            http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS,
+        ),
+    )
+
+
+_USAGE_KEYS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+_get_usage_counts = attrgetter(*_USAGE_KEYS)
+
+
 def _empty_usage() -> dict:
     """Return a zeroed-out usage dict."""
-    return {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_creation_input_tokens": 0,
-        "cache_read_input_tokens": 0,
-    }
+    return dict.fromkeys(_USAGE_KEYS, 0)
+
+
+def _usage_counts(usage) -> tuple[int, int, int, int]:
+    """Read the four token counts from a response usage object (None -> 0)."""
+    return tuple(count or 0 for count in _get_usage_counts(usage))
 
 
 def _accumulate_usage(totals: dict, usage) -> None:
     """Add token counts from an API response usage object into *totals*."""
-    totals["input_tokens"] += getattr(usage, "input_tokens", 0)
-    totals["output_tokens"] += getattr(usage, "output_tokens", 0)
-    totals["cache_creation_input_tokens"] += getattr(
-        usage, "cache_creation_input_tokens", 0
-    )
-    totals["cache_read_input_tokens"] += getattr(
-        usage, "cache_read_input_tokens", 0
-    )
+    for key, count in zip(_USAGE_KEYS, _usage_counts(usage)):
+        totals[key] += count
 
 
 def analyze_articles(
@@ -63,7 +122,8 @@ def analyze_articles(
     batch_size: int = 25,
     extra_fields: list[dict] | None = None,
     subject_slug: str = "",
-    use_batch_api: bool = False,
+    dispatch_mode: Literal["auto", "sync", "batch"] = "auto",
+    max_concurrency: int = 4,
 ) -> tuple[list[dict], dict]:
     """Analyze articles through Claude API with a subject-specific system prompt.
 
@@ -75,7 +135,10 @@ def analyze_articles(
         batch_size: Articles per API call.
         extra_fields: List of {field, default} dicts for subject-specific fields.
         subject_slug: Subject slug for log directory namespacing.
-        use_batch_api: Use the Messages Batch API (50% cheaper, async).
+        dispatch_mode: "batch" uses the Messages Batch API (50% cheaper,
+            async), "sync" uses concurrent Messages API calls, and "auto"
+            picks the Batch API when there are more than two batches.
+        max_concurrency: Max requests in flight at once on the sync path.
 
     Returns (results, usage) — a list of analyzed article dicts and a dict of
     total token usage across all batches.
@@ -90,41 +153,32 @@ def analyze_articles(
         for field_spec in extra_fields:
             optional_defaults[field_spec["field"]] = field_spec.get("default", "")
 
-    client = anthropic.Anthropic()
-    all_results = []
-    total_usage = _empty_usage()
+    # Identical articles are analyzed once and their results copied back
+    articles, duplicates = _split_duplicates(articles)
 
+    # One system block shared by reference across every request in this run
+    system_block = _build_system_block(system_prompt)
     batches = [articles[i : i + batch_size] for i in range(0, len(articles), batch_size)]
+    user_messages = [_build_user_message(batch) for batch in batches]
     logger.info("Analyzing %d articles in %d batch(es)", len(articles), len(batches))
 
-    if use_batch_api:
-        results, usage = _analyze_via_batch_api(
-            client, system_prompt, batches, model, max_tokens,
+    if dispatch_mode == "auto":
+        dispatch_mode = "batch" if len(articles) > batch_size * 2 else "sync"
+    logger.info("Dispatch mode: %s", dispatch_mode)
+
+    if dispatch_mode == "batch":
+        all_results, total_usage = _analyze_via_batch_api(
+            _get_client(), system_block, batches, user_messages, model, max_tokens,
             optional_defaults, subject_slug,
         )
-        all_results.extend(results)
-        for key in total_usage:
-            total_usage[key] += usage[key]
     else:
-        for batch_idx, batch in enumerate(batches):
-            try:
-                result, usage = _analyze_batch(
-                    client, system_prompt, batch, model, max_tokens,
-                    optional_defaults,
-                )
-                all_results.extend(result)
-                _accumulate_usage(total_usage, usage)
-                logger.info(
-                    "Batch %d usage: %d in / %d out / %d cache-create / %d cache-read",
-                    batch_idx,
-                    getattr(usage, "input_tokens", 0),
-                    getattr(usage, "output_tokens", 0),
-                    getattr(usage, "cache_creation_input_tokens", 0),
-                    getattr(usage, "cache_read_input_tokens", 0),
-                )
-            except Exception as e:
-                logger.error("Batch %d analysis failed after retries: %s", batch_idx, e)
-                _save_failed_batch(batch, subject_slug)
+        all_results, total_usage = asyncio.run(_analyze_concurrently(
+            system_block, batches, user_messages, model, max_tokens,
+            optional_defaults, subject_slug, max_concurrency,
+        ))
+
+    if duplicates:
+        all_results.extend(_copy_duplicate_results(all_results, articles, duplicates))
 
     logger.info(
         "Total token usage: %d in / %d out / %d cache-create / %d cache-read",
@@ -137,76 +191,227 @@ def analyze_articles(
     return all_results, total_usage
 
 
+def _article_key(article: dict) -> str | tuple[str, str]:
+    """Identity of an article for pre-analysis dedup: URL, else title+snippet."""
+    return article.get("url") or (article.get("title", ""), article.get("snippet", ""))
+
+
+def _split_duplicates(
+    articles: list[dict],
+) -> tuple[list[dict], dict[str | tuple[str, str], list[dict]]]:
+    """Split articles into uniques and duplicates of an earlier article.
+
+    Returns (unique_articles, duplicates) where duplicates maps an article
+    key to the later copies that share it.
+    """
+    seen: set[str | tuple[str, str]] = set()
+    unique = []
+    duplicates: dict[str | tuple[str, str], list[dict]] = {}
+    for article in articles:
+        key = _article_key(article)
+        if key in seen:
+            duplicates.setdefault(key, []).append(article)
+        else:
+            seen.add(key)
+            unique.append(article)
+
+    if duplicates:
+        skipped = [a for copies in duplicates.values() for a in copies]
+        approx_tokens = sum(len(orjson.dumps(_article_payload(a))) for a in skipped) // 4
+        logger.info(
+            "Skipping %d duplicate article(s) before analysis (~%d input tokens saved)",
+            len(skipped), approx_tokens,
+        )
+    return unique, duplicates
+
+
+def _copy_duplicate_results(
+    results: list[dict],
+    articles: list[dict],
+    duplicates: dict[str | tuple[str, str], list[dict]],
+) -> list[dict]:
+    """Build a result for each skipped duplicate from its original's result.
+
+    Results are matched back to the analyzed *articles* by source URL first.
+    Only groups still unmatched then fall back to the normalized headline,
+    and only from results whose source_url names no analyzed article, so a
+    syndicated copy of the same story cannot claim another group.
+    """
+    matches: dict[str | tuple[str, str], dict] = {}
+    for r in results:
+        key = r.get("source_url")
+        if key in duplicates and key not in matches:
+            matches[key] = r
+
+    if len(matches) < len(duplicates):
+        analyzed_urls = {a["url"] for a in articles if a.get("url")}
+        titles = {
+            _normalize_title(copies[0].get("title", "")): key
+            for key, copies in duplicates.items()
+            if key not in matches
+        }
+        for r in results:
+            if r.get("source_url") in analyzed_urls:
+                continue
+            key = titles.get(_normalize_title(r.get("headline", "")))
+            if key is not None and key not in matches:
+                matches[key] = r
+
+    copied = [dict(r) for key, r in matches.items() for _ in duplicates[key]]
+
+    unmatched = sum(len(copies) for key, copies in duplicates.items() if key not in matches)
+    if unmatched:
+        logger.warning(
+            "Could not match %d duplicate article(s) to an analysis result", unmatched
+        )
+    return copied
+
+
+def _normalize_title(title: str) -> str:
+    """Lowercase *title* and drop a trailing " - Source" suffix for matching."""
+    head, sep, _ = title.rpartition(" - ")
+    return (head if sep else title).strip().lower()
+
+
+def _build_system_block(system_prompt: str) -> list[dict]:
+    """Build the cached system blocks sent with every request.
+
+    The subject prompt and the shared instructions each end in a cache
+    breakpoint; only the per-batch articles stay outside the cached prefix.
+    """
+    return [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": _ANALYSIS_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+
+def _article_payload(article: dict) -> dict:
+    """Select the fields of one article that are sent to Claude."""
+    entry = dict(zip(_PAYLOAD_FIELDS, _get_payload_fields(article)))
+    # Include full_text if enrichment provided it
+    if article.get("full_text"):
+        entry["full_text"] = article["full_text"]
+    # Include signal_strength if dedup provided it
+    if (article.get("signal_strength") or 0) > 1:
+        entry["signal_strength"] = article["signal_strength"]
+    return entry
+
+
 def _build_user_message(articles: list[dict]) -> str:
     """Build the user message for a batch of articles."""
-    articles_payload = []
-    for a in articles:
-        entry = {
-            "title": a["title"],
-            "snippet": a["snippet"],
-            "url": a["url"],
-            "published": a["published"],
-            "source": a["source"],
-        }
-        # Include full_text if enrichment provided it
-        if a.get("full_text"):
-            entry["full_text"] = a["full_text"]
-        # Include signal_strength if dedup provided it
-        if a.get("signal_strength") and a["signal_strength"] > 1:
-            entry["signal_strength"] = a["signal_strength"]
-        articles_payload.append(entry)
+    payload_json = orjson.dumps(
+        [_article_payload(a) for a in articles], option=orjson.OPT_INDENT_2
+    ).decode()
+    # The count varies per batch, so it goes after the articles rather than
+    # in any shared preamble that could otherwise be reused across batches
     return (
-        f"Analyze the following {len(articles_payload)} articles. "
-        f"Return a JSON array with EXACTLY {len(articles_payload)} objects — "
-        f"one KEEP or KILL decision per article. Do not skip any.\n\n"
-        f"```json\n{json.dumps(articles_payload, indent=2)}\n```"
+        f"```json\n{payload_json}\n```\n\n"
+        f"That is {len(articles)} articles — return EXACTLY "
+        f"{len(articles)} objects."
     )
 
 
+async def _analyze_concurrently(
+    system_block: list[dict],
+    batches: list[list[dict]],
+    user_messages: list[str],
+    model: str,
+    max_tokens: int,
+    optional_defaults: dict,
+    subject_slug: str,
+    max_concurrency: int,
+) -> tuple[list[dict], dict]:
+    """Run batches through the Messages API with up to *max_concurrency* in flight.
+
+    Batch 0 runs alone so it writes the prompt cache before the remaining
+    batches fan out and read from it. Completed batches are parsed while the
+    rest are still waiting on the network. Returns (results, usage_totals)
+    with results in batch order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    result_map: dict[int, list[dict]] = {}
+    total_usage = _empty_usage()
+
+    def record(batch_idx: int, outcome, error: Exception | None) -> None:
+        if error is not None:
+            logger.error("Batch %d analysis failed after retries: %s", batch_idx, error)
+            _save_failed_batch(batches[batch_idx], subject_slug)
+            return
+        result, usage = outcome
+        result_map[batch_idx] = result
+        _accumulate_usage(total_usage, usage)
+        logger.info(
+            "Batch %d usage: %d in / %d out / %d cache-create / %d cache-read",
+            batch_idx,
+            *_usage_counts(usage),
+        )
+
+    async with _new_async_client() as client:
+
+        async def run(batch_idx: int):
+            async with semaphore:
+                try:
+                    return batch_idx, await _analyze_batch_async(
+                        client, system_block, batches[batch_idx],
+                        user_messages[batch_idx], model, max_tokens,
+                        optional_defaults,
+                    ), None
+                except Exception as e:
+                    return batch_idx, None, e
+
+        if batches:
+            record(*await run(0))
+
+        tasks = [asyncio.create_task(run(idx)) for idx in range(1, len(batches))]
+        for next_done in asyncio.as_completed(tasks):
+            record(*await next_done)
+
+    return _in_batch_order(result_map), total_usage
+
+
 @retry_with_backoff(
     max_retries=2,
     base_delay=5.0,
     backoff_factor=2.0,
     exceptions=(anthropic.APIError,),
 )
-def _analyze_batch(
-    client: anthropic.Anthropic,
-    system_prompt: str,
+async def _analyze_batch_async(
+    client: anthropic.AsyncAnthropic,
+    system_block: list[dict],
     articles: list[dict],
+    user_message: str,
     model: str,
     max_tokens: int,
     optional_defaults: dict,
 ) -> tuple[list[dict], object]:
     """Send one batch of articles to Claude for analysis.
 
+    *user_message* is the pre-built prompt for *articles*, so retries reuse it.
     Returns (results, usage) where usage is the response.usage object.
     """
-    response = client.messages.create(
+    response = await client.messages.create(
         model=model,
         max_tokens=max_tokens,
-        system=[{
-            "type": "text",
-            "text": system_prompt,
-            "cache_control": {"type": "ephemeral"},
-        }],
-        messages=[{"role": "user", "content": _build_user_message(articles)}],
+        system=system_block,
+        messages=[{"role": "user", "content": user_message}],
     )
 
-    if response.stop_reason == "max_tokens":
-        logger.warning(
-            "Response truncated (hit max_tokens=%d). "
-            "Consider reducing batch_size or increasing max_tokens.",
-            max_tokens,
-        )
-
-    response_text = response.content[0].text
-    return _parse_response(response_text, articles, optional_defaults), response.usage
+    return _parse_message(response, articles, optional_defaults), response.usage
 
 
 def _analyze_via_batch_api(
     client: anthropic.Anthropic,
-    system_prompt: str,
+    system_block: list[dict],
     batches: list[list[dict]],
+    user_messages: list[str],
     model: str,
     max_tokens: int,
     optional_defaults: dict,
@@ -216,75 +421,98 @@ def _analyze_via_batch_api(
 
     Returns (results, usage_totals).
     """
-    system_block = [{
-        "type": "text",
-        "text": system_prompt,
-        "cache_control": {"type": "ephemeral"},
-    }]
-
-    requests = []
-    for batch_idx, batch in enumerate(batches):
-        requests.append({
+    requests = [
+        {
             "custom_id": f"batch-{batch_idx}",
             "params": {
                 "model": model,
                 "max_tokens": max_tokens,
                 "system": system_block,
-                "messages": [{"role": "user", "content": _build_user_message(batch)}],
+                "messages": [{"role": "user", "content": user_message}],
             },
-        })
+        }
+        for batch_idx, user_message in enumerate(user_messages)
+    ]
 
     logger.info("Submitting %d request(s) to Messages Batch API", len(requests))
     message_batch = client.messages.batches.create(requests=requests)
     batch_id = message_batch.id
     logger.info("Batch created: %s — polling for completion", batch_id)
 
-    poll_interval = 10
+    # Poll quickly at first, then back off exponentially — batches can take
+    # anywhere from minutes to hours, and each retrieve is an API call
+    poll_start = time.monotonic()
+    poll_count = 0
     while True:
         message_batch = client.messages.batches.retrieve(batch_id)
         status = message_batch.processing_status
+        counts = message_batch.request_counts
         logger.info(
-            "Batch %s: %s (succeeded=%d, errored=%d, expired=%d, canceled=%d)",
+            "Batch %s: %s after %.0fs (succeeded=%d, errored=%d, expired=%d, canceled=%d)",
             batch_id,
             status,
-            message_batch.request_counts.succeeded,
-            message_batch.request_counts.errored,
-            message_batch.request_counts.expired,
-            message_batch.request_counts.canceled,
+            time.monotonic() - poll_start,
+            counts.succeeded,
+            counts.errored,
+            counts.expired,
+            counts.canceled,
         )
-        if status == "ended":
+        if status in _BATCH_TERMINAL_STATUSES:
             break
-        time.sleep(poll_interval)
+        # Every request has finished but results only become retrievable
+        # once the batch reports "ended" — check again shortly
+        finished = counts.succeeded + counts.errored + counts.expired + counts.canceled
+        if finished >= len(requests):
+            time.sleep(2)
+            continue
+        time.sleep(min(300, max(2, 2 * 1.5**poll_count)))
+        poll_count += 1
 
-    # Collect results ordered by batch index
-    result_map: dict[int, tuple[list[dict], dict]] = {}
+    # Collect results ordered by batch index. Parsing runs on worker threads
+    # so the results stream keeps downloading while responses are decoded.
+    parse_futures = {}
     total_usage = _empty_usage()
 
-    for entry in client.messages.batches.results(batch_id):
-        batch_idx = int(entry.custom_id.split("-")[1])
-        if entry.result.type == "succeeded":
-            msg = entry.result.message
-            usage = msg.usage
-            _accumulate_usage(total_usage, usage)
-            if msg.stop_reason == "max_tokens":
-                logger.warning("Batch request %s truncated", entry.custom_id)
-            response_text = msg.content[0].text
-            parsed = _parse_response(
-                response_text, batches[batch_idx], optional_defaults,
-            )
-            result_map[batch_idx] = parsed
-        else:
-            logger.error(
-                "Batch request %s failed: %s", entry.custom_id, entry.result.type,
-            )
-            _save_failed_batch(batches[batch_idx], subject_slug)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for entry in client.messages.batches.results(batch_id):
+            batch_idx = int(entry.custom_id.split("-")[1])
+            if entry.result.type == "succeeded":
+                msg = entry.result.message
+                _accumulate_usage(total_usage, msg.usage)
+                parse_futures[batch_idx] = executor.submit(
+                    _parse_message, msg, batches[batch_idx], optional_defaults,
+                )
+            else:
+                logger.error(
+                    "Batch request %s failed: %s", entry.custom_id, entry.result.type,
+                )
+                _save_failed_batch(batches[batch_idx], subject_slug)
+
+    result_map = {idx: future.result() for idx, future in parse_futures.items()}
+    return _in_batch_order(result_map), total_usage
 
-    # Reassemble in order
+
+def _in_batch_order(result_map: dict[int, list[dict]]) -> list[dict]:
+    """Flatten per-batch results back into submission order."""
     all_results = []
     for idx in sorted(result_map):
         all_results.extend(result_map[idx])
+    return all_results
 
-    return all_results, total_usage
+
+def _parse_message(
+    message, original_articles: list[dict], optional_defaults: dict
+) -> list[dict]:
+    """Parse a Messages API response for one batch, warning on truncation.
+
+    Shared by the sync and Batch API paths so both handle responses the same way.
+    """
+    if message.stop_reason == "max_tokens":
+        logger.warning(
+            "Response truncated (hit max_tokens). "
+            "Consider reducing batch_size or increasing max_tokens."
+        )
+    return _parse_response(message.content[0].text, original_articles, optional_defaults)
 
 
 def _parse_response(
@@ -301,23 +529,27 @@ def _parse_response(
     except json.JSONDecodeError:
         pass
 
-    # Fallback: extract JSON from markdown code fences or raw text
-    patterns = [
-        r"```json\s*\n(.*?)\n\s*```",
-        r"```\s*\n(.*?)\n\s*```",
-        r"(\[[\s\S]*\])",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, response_text, re.DOTALL)
-        if match:
-            try:
-                data = json.loads(match.group(1))
-                if isinstance(data, list):
-                    return _validate_results(data, optional_defaults)
-                if isinstance(data, dict) and "articles" in data:
-                    return _validate_results(data["articles"], optional_defaults)
-            except json.JSONDecodeError:
-                continue
+    # Fallback: strip a leading code fence, then decode the first JSON array.
+    # raw_decode stops at the end of the array, so a closing fence or
+    # trailing prose is ignored without any regex backtracking. A bracket in
+    # leading prose ("Analysis [25 items]:") is skipped for the next one.
+    # An empty array is only accepted once every other candidate has failed.
+    text = response_text.lstrip()
+    if text.startswith("```"):
+        newline = text.find("\n")
+        text = text[newline + 1:] if newline != -1 else ""
+    saw_empty = False
+    start = text.find("[")
+    while start != -1:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            data = None
+        if data == []:
+            saw_empty = True
+        elif isinstance(data, list) and any(isinstance(r, dict) for r in data):
+            return _validate_results(data, optional_defaults)
+        start = text.find("[", start + 1)
 
     # Last resort: try to extract individual JSON objects from truncated response
     objects = _extract_partial_json_objects(response_text)
@@ -326,6 +558,8 @@ def _parse_response(
             "Extracted %d partial JSON objects from truncated response", len(objects)
         )
         return _validate_results(objects, optional_defaults)
+    if saw_empty:
+        return []
 
     logger.error("Could not parse JSON from Claude response")
     logger.debug("Raw response (first 500 chars): %s", response_text[:500])
@@ -337,27 +571,37 @@ def _extract_partial_json_objects(text: str) -> list[dict]:
     """Extract complete JSON objects from a potentially truncated JSON array.
 
     When the response is truncated mid-array, individual objects up to the
-    truncation point may still be valid.
+    truncation point may still be valid. Each raw_decode call consumes one
+    whole object (braces inside string values included) and returns the
+    index just past it. Each "[" is tried as the array start in turn, so
+    brackets in leading prose do not hide the real array.
     """
+    start = text.find("[")
+    if start == -1:
+        return _scan_json_objects(text, max(text.find("{"), 0))
+    while start != -1:
+        objects = _scan_json_objects(text, start + 1)
+        if objects:
+            return objects
+        start = text.find("[", start + 1)
+    return []
+
+
+def _scan_json_objects(text: str, i: int) -> list[dict]:
+    """Decode consecutive comma-separated JSON objects starting at index *i*."""
     objects = []
-    # Find all {...} blocks that look like complete objects
-    depth = 0
-    start = None
-    for i, char in enumerate(text):
-        if char == "{":
-            if depth == 0:
-                start = i
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0 and start is not None:
-                try:
-                    obj = json.loads(text[start : i + 1])
-                    if isinstance(obj, dict) and "decision" in obj:
-                        objects.append(obj)
-                except json.JSONDecodeError:
-                    pass
-                start = None
+    n = len(text)
+    while i < n:
+        while i < n and text[i] in " \t\r\n,":
+            i += 1
+        if i >= n or text[i] != "{":
+            break
+        try:
+            obj, i = _JSON_DECODER.raw_decode(text, i)
+        except json.JSONDecodeError:
+            break
+        if isinstance(obj, dict) and "decision" in obj:
+            objects.append(obj)
     return objects
 
 
@@ -368,19 +612,18 @@ def _validate_results(results: list, optional_defaults: dict) -> list[dict]:
         if not isinstance(r, dict):
             continue
 
-        # Accept either 'headline' or 'title' for the headline field
-        if "title" in r and "headline" not in r:
-            r["headline"] = r["title"]
-
-        # Check required fields
-        missing = _REQUIRED_FIELDS - set(r.keys())
-        if missing:
-            logger.warning("Skipping result missing required fields: %s", missing)
+        # Check required fields — 'title' is accepted in place of 'headline'
+        if "decision" not in r or ("headline" not in r and "title" not in r):
+            logger.warning(
+                "Skipping result missing required fields: %s",
+                _REQUIRED_FIELDS - r.keys(),
+            )
             continue
 
-        # Apply defaults for optional fields
-        for field, default in optional_defaults.items():
-            r.setdefault(field, default)
+        # Apply defaults for optional fields in a single merge
+        r = {**optional_defaults, **r}
+        if "headline" not in r:
+            r["headline"] = r["title"]
 
         # Normalize decision
         r["decision"] = str(r["decision"]).upper()
@@ -421,14 +664,23 @@ def _validate_results(results: list, optional_defaults: dict) -> list[dict]:
     return validated
 
 
-def _save_failed_batch(articles: list[dict], subject_slug: str = "") -> None:
-    """Save failed articles to logs/failed/<subject>/ for later inspection."""
+@functools.lru_cache(maxsize=64)
+def _failed_dir(subject_slug: str) -> Path:
+    """Return logs/failed/<subject>/, creating it on first use."""
+    failed_dir = Path(__file__).parent.parent / "logs" / "failed"
     if subject_slug:
-        failed_dir = Path(__file__).parent.parent / "logs" / "failed" / subject_slug
-    else:
-        failed_dir = Path(__file__).parent.parent / "logs" / "failed"
+        failed_dir = failed_dir / subject_slug
     failed_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.json"
-    filepath = failed_dir / filename
-    filepath.write_text(json.dumps(articles, indent=2), encoding="utf-8")
-    logger.info("Saved failed batch to %s", filepath)
+    return failed_dir
+
+
+def _save_failed_batch(articles: list[dict], subject_slug: str = "") -> None:
+    """Append failed articles to logs/failed/<subject>/failures.jsonl.
+
+    Each failure is one line: {"ts": ISO timestamp, "articles": [...]}.
+    """
+    filepath = _failed_dir(subject_slug) / "failures.jsonl"
+    record = orjson.dumps({"ts": datetime.now().isoformat(), "articles": articles})
+    with _failed_lock, open(filepath, "ab") as f:
+        f.write(record + b"\n")
+    logger.info("Saved failed batch (%d articles) to %s", len(articles), filepath)
@@ -6,6 +6,8 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Prefixes to strip when normalizing geographic names
@@ -19,6 +21,9 @@ _STRIP_SUFFIXES = [
     " city", " town", " village", " cdp", " area",
 ]
 
+# Collapses runs of whitespace in normalized names
+_WHITESPACE_RUN = re.compile(r"\s+")
+
 
 def detect_cross_signals(
     infra_opps: list[dict], rezone_opps: list[dict]
@@ -79,7 +84,7 @@ def _normalize_geo(name: str) -> str:
         if name.endswith(suffix):
             name = name[: -len(suffix)]
     # Remove extra whitespace
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _WHITESPACE_RUN.sub(" ", name).strip()
     return name
 
 
@@ -214,8 +219,8 @@ def save_cross_signals(
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{date}.json"
 
-    out_path.write_text(
-        json.dumps(cross_signals, indent=2, default=str), encoding="utf-8"
+    out_path.write_bytes(
+        orjson.dumps(cross_signals, option=orjson.OPT_INDENT_2, default=str)
     )
     logger.info("Saved %d cross-signals to %s", len(cross_signals), out_path)
     return out_path
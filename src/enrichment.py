@@ -6,6 +6,7 @@ from typing import Any
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,9 @@ _USER_AGENT = "Mozilla/5.0 (compatible; NewsBot/1.0)"
 _FETCH_TIMEOUT = 10
 _DELAY_BETWEEN_REQUESTS = 1
 _MAX_TEXT_LENGTH = 2000
+# Publisher hosts to keep warm connections for; fetches are sequential,
+# so one pooled connection per host is enough
+_POOL_HOSTS = 32
 _PAYWALL_KEYWORDS = {
     "subscribe", "subscription", "sign in to read", "premium content",
     "members only", "paywall", "register to continue", "log in to read",
@@ -35,28 +39,29 @@ def enrich_articles(articles: list[dict]) -> list[dict]:
     start_time = time.time()
     stats: dict[str, int] = {"success": 0, "timeout": 0, "error": 0, "paywall": 0}
 
-    for i, article in enumerate(articles):
-        url = article.get("url", "")
-        if not url:
-            article["full_text"] = None
-            article["fetch_status"] = "error"
-            stats["error"] += 1
-            continue
-
-        try:
-            full_text, status = _fetch_article_text(url)
-            article["full_text"] = full_text
-            article["fetch_status"] = status
-            stats[status] += 1
-        except Exception as e:
-            logger.debug("Enrichment failed for %s: %s", url[:80], e)
-            article["full_text"] = None
-            article["fetch_status"] = "error"
-            stats["error"] += 1
-
-        # Rate limiting: 1-second delay between requests
-        if i < len(articles) - 1:
-            time.sleep(_DELAY_BETWEEN_REQUESTS)
+    with _new_session() as session:
+        for i, article in enumerate(articles):
+            url = article.get("url", "")
+            if not url:
+                article["full_text"] = None
+                article["fetch_status"] = "error"
+                stats["error"] += 1
+                continue
+
+            try:
+                full_text, status = _fetch_article_text(session, url)
+                article["full_text"] = full_text
+                article["fetch_status"] = status
+                stats[status] += 1
+            except Exception as e:
+                logger.debug("Enrichment failed for %s: %s", url[:80], e)
+                article["full_text"] = None
+                article["fetch_status"] = "error"
+                stats["error"] += 1
+
+            # Rate limiting: 1-second delay between requests
+            if i < len(articles) - 1:
+                time.sleep(_DELAY_BETWEEN_REQUESTS)
 
     elapsed = round(time.time() - start_time, 1)
     logger.info(
@@ -86,19 +91,30 @@ def get_enrichment_stats(articles: list[dict]) -> dict[str, Any]:
     }
 
 
-def _fetch_article_text(url: str) -> tuple[str | None, str]:
+def _new_session() -> requests.Session:
+    """Create a keep-alive session for one enrichment run.
+
+    Several articles per run usually come from the same publisher, so
+    reusing the connection skips a TCP + TLS handshake for each of them.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = _USER_AGENT
+    adapter = HTTPAdapter(pool_connections=_POOL_HOSTS, pool_maxsize=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _fetch_article_text(
+    session: requests.Session, url: str
+) -> tuple[str | None, str]:
     """Fetch and extract article text from a URL.
 
     Returns (text, status) where status is one of:
     "success", "timeout", "error", "paywall".
     """
     try:
-        resp = requests.get(
-            url,
-            timeout=_FETCH_TIMEOUT,
-            headers={"User-Agent": _USER_AGENT},
-            allow_redirects=True,
-        )
+        resp = session.get(url, timeout=_FETCH_TIMEOUT, allow_redirects=True)
     except requests.Timeout:
         return None, "timeout"
     except requests.RequestException:
@@ -1,20 +1,32 @@
 """Google News RSS fetcher with retry, deduplication, and date filtering."""
 
-import calendar
+import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from email.utils import parsedate_to_datetime
+from operator import attrgetter
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
+import aiohttp
 import feedparser
-import requests
-
-from src.utils import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = "Mozilla/5.0 (compatible; RezoningMonitor/1.0)"
+
+# Per-keyword retry policy for RSS fetches
+_FETCH_MAX_RETRIES = 3
+_FETCH_BASE_DELAY = 2.0
+_FETCH_BACKOFF_FACTOR = 2.0
+_FETCH_MAX_RETRY_AFTER = 60.0
+
 # Google News tracking params to strip during deduplication
-_TRACKING_PARAMS = {
+_TRACKING_PARAMS = frozenset({
     "oc",
     "ved",
     "usg",
@@ -24,7 +36,48 @@ _TRACKING_PARAMS = {
     "utm_term",
     "utm_content",
     "fbclid",
-}
+})
+# Sort key for newest-first ordering (ISO timestamps sort lexically)
+_by_published = attrgetter("published")
+
+# FeedParserDict.get() remaps legacy key aliases on every call; entries store
+# the canonical keys, so read them with the plain dict lookup instead
+_field = dict.get
+
+# "name=" forms for a cheap substring pre-check before parsing a query
+_TRACKING_PREFIXES = tuple(f"{p}=" for p in _TRACKING_PARAMS)
+
+
+@dataclass(slots=True)
+class _Article:
+    """An RSS article while it moves through fetch, resolve and dedup.
+
+    Slotted records are smaller and faster to read than per-article dicts;
+    callers still get plain dicts from fetch_all_articles via as_dict().
+    """
+
+    title: str
+    snippet: str
+    url: str
+    published: str
+    source: str
+    keyword: str
+    title_key: int  # digest of the normalized headline, for dedup
+    original_google_url: str = ""
+
+    def as_dict(self) -> dict:
+        """Return the public article dict (original_google_url only if resolved)."""
+        article = {
+            "title": self.title,
+            "snippet": self.snippet,
+            "url": self.url,
+            "published": self.published,
+            "source": self.source,
+            "keyword": self.keyword,
+        }
+        if self.original_google_url:
+            article["original_google_url"] = self.original_google_url
+        return article
 
 
 def fetch_all_articles(
@@ -38,46 +91,59 @@ def fetch_all_articles(
     capped at max_articles. Google News redirect URLs are resolved to
     actual article URLs before deduplication.
     """
-    from src.url_resolver import resolve_urls
-
-    # Step 1: Collect all raw articles from all keywords
-    raw_articles = []
-    for keyword in keywords:
-        try:
-            articles = _fetch_keyword(keyword, lookback_days)
-            raw_articles.extend(articles)
-        except Exception as e:
-            logger.error("Failed to fetch keyword '%s': %s", keyword, e)
+    from src.url_resolver import resolve_url_map
+
+    # Step 1: Collect all raw articles from all keywords concurrently
+    per_keyword = asyncio.run(_fetch_keywords(keywords, lookback_days))
+    keyword_articles = []
+    for keyword, result in zip(keywords, per_keyword):
+        if isinstance(result, Exception):
+            logger.error("Failed to fetch keyword '%s': %s", keyword, result)
             continue
+        keyword_articles.append(result)
 
     # Step 2: Resolve Google News redirect URLs to actual article URLs
-    resolve_urls(raw_articles)
-
-    # Step 3: Deduplicate on resolved URLs
-    seen_urls: set[str] = set()
+    all_articles = list(itertools.chain.from_iterable(keyword_articles))
+    resolved = resolve_url_map([a.url for a in all_articles])
+    for article in all_articles:
+        target = resolved.get(article.url)
+        if target:
+            article.original_google_url = article.url
+            article.url = target
+
+    # Step 3: Deduplicate on resolved URLs, then on headline, in one pass
+    # across all keywords. The headline check catches cases where URL
+    # resolution fails and two different Google News URLs point to the same
+    # article. Survivors stay grouped per keyword, newest first.
+    seen_urls: set[int] = set()
+    seen_titles: set[int] = set()
     deduplicated = []
-    for article in raw_articles:
-        normalized = _normalize_url(article["url"])
-        if normalized not in seen_urls:
+    for articles in keyword_articles:
+        unique = []
+        for article in articles:
+            normalized = _digest(_normalize_url(article.url))
+            if normalized in seen_urls:
+                continue
             seen_urls.add(normalized)
-            deduplicated.append(article)
-
-    # Second pass: headline-based dedup (catches cases where URL resolution
-    # fails and two different Google News URLs point to the same article)
-    seen_titles: set[str] = set()
-    title_deduped = []
-    for article in deduplicated:
-        title_key = article["title"].lower().strip()
-        if title_key not in seen_titles:
-            seen_titles.add(title_key)
-            title_deduped.append(article)
-        else:
-            logger.debug("Title dedup removed: %s", article["title"][:80])
-    deduplicated = title_deduped
-
-    # Sort by published date descending, cap at max
-    deduplicated.sort(key=lambda a: a["published"], reverse=True)
-    result = deduplicated[:max_articles]
+
+            if article.title_key in seen_titles:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Title dedup removed: %s", article.title[:80])
+                continue
+            seen_titles.add(article.title_key)
+            unique.append(article)
+        # Feeds are close to reverse-chronological already, so this is ~linear
+        unique.sort(key=_by_published, reverse=True)
+        deduplicated.append(unique)
+
+    # Step 4: Merge the sorted per-keyword runs and stop at max_articles
+    result = [
+        article.as_dict()
+        for article in itertools.islice(
+            heapq.merge(*deduplicated, key=_by_published, reverse=True),
+            max_articles,
+        )
+    ]
     logger.info(
         "Fetched %d unique articles from %d keywords (capped at %d)",
         len(result),
@@ -87,29 +153,96 @@ def fetch_all_articles(
     return result
 
 
-@retry_with_backoff(
-    max_retries=3,
-    base_delay=2.0,
-    backoff_factor=2.0,
-    exceptions=(requests.RequestException,),
-)
-def _fetch_keyword(keyword: str, lookback_days: int) -> list[dict]:
-    """Fetch Google News RSS for a single keyword."""
+async def _fetch_keywords(
+    keywords: list[str], lookback_days: int
+) -> list[list[_Article] | BaseException]:
+    """Fetch every keyword's RSS feed over one shared session.
+
+    Returns one entry per keyword, in order: its article list, or the
+    exception that made it fail (so one bad keyword doesn't sink the rest).
+    """
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=15),
+        headers={"User-Agent": _USER_AGENT},
+    ) as session:
+        return await asyncio.gather(
+            *(_afetch_keyword(session, kw, lookback_days) for kw in keywords),
+            return_exceptions=True,
+        )
+
+
+async def _afetch_keyword(
+    session: aiohttp.ClientSession, keyword: str, lookback_days: int
+) -> list[_Article]:
+    """Fetch Google News RSS for a single keyword.
+
+    Retries with exponential backoff; a 429 waits for the server's
+    Retry-After instead. Backoff sleeps only this keyword's task, so other
+    keywords keep fetching meanwhile.
+    """
     encoded = quote_plus(keyword)
     url = (
         f"https://news.google.com/rss/search"
         f"?q={encoded}+when:{lookback_days}d&hl=en-US&gl=US&ceid=US:en"
     )
 
-    logger.debug("Fetching RSS: %s", url)
-    resp = requests.get(
-        url,
-        timeout=15,
-        headers={"User-Agent": "Mozilla/5.0 (compatible; RezoningMonitor/1.0)"},
-    )
-    resp.raise_for_status()
+    for attempt in range(_FETCH_MAX_RETRIES):
+        delay = _FETCH_BASE_DELAY * (_FETCH_BACKOFF_FACTOR**attempt)
+        last_attempt = attempt == _FETCH_MAX_RETRIES - 1
+        try:
+            logger.debug("Fetching RSS: %s", url)
+            async with session.get(url) as resp:
+                if resp.status == 429 and not last_attempt:
+                    delay = _retry_after(resp.headers.get("Retry-After"), delay)
+                    logger.warning(
+                        "Rate limited fetching keyword '%s'. Retrying in %.1fs",
+                        keyword,
+                        delay,
+                    )
+                else:
+                    resp.raise_for_status()
+                    text = await resp.text()
+                    return _parse_feed(text, keyword, lookback_days)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            if last_attempt:
+                raise
+            logger.warning(
+                "Attempt %d/%d for keyword '%s' failed: %s. Retrying in %.1fs",
+                attempt + 1,
+                _FETCH_MAX_RETRIES,
+                keyword,
+                e,
+                delay,
+            )
+        await asyncio.sleep(delay)
+
+    return []
+
+
+def _retry_after(header: str | None, default: float) -> float:
+    """Seconds to wait from a Retry-After header, or *default* if absent/unparseable.
+
+    Waits longer than _FETCH_MAX_RETRY_AFTER also fall back to *default* so a
+    hostile or misconfigured server cannot stall the whole fetch.
+    """
+    if not header:
+        return default
+    try:
+        wait = max(0.0, float(header))
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(header)
+            wait = max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+        except (ValueError, TypeError):
+            return default
+    return wait if wait <= _FETCH_MAX_RETRY_AFTER else default
+
 
-    feed = feedparser.parse(resp.text)
+def _parse_feed(text: str, keyword: str, lookback_days: int) -> list[_Article]:
+    """Parse one keyword's RSS body into articles within the lookback window."""
+    feed = feedparser.parse(text)
 
     if feed.bozo and not feed.entries:
         logger.warning(
@@ -117,7 +250,7 @@ def _fetch_keyword(keyword: str, lookback_days: int) -> list[dict]:
         )
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
+    cutoff = datetime.now(UTC) - timedelta(days=lookback_days)
     articles = []
 
     for entry in feed.entries:
@@ -125,47 +258,72 @@ def _fetch_keyword(keyword: str, lookback_days: int) -> list[dict]:
         if published and published < cutoff:
             continue
 
-        title = entry.get("title", "")
+        title = _field(entry, "title", "")
         articles.append(
-            {
-                "title": title,
-                "snippet": entry.get("summary", entry.get("description", "")),
-                "url": entry.get("link", ""),
-                "published": published.isoformat() if published else "",
-                "source": _extract_source(entry, title),
-                "keyword": keyword,
-            }
+            _Article(
+                title=title,
+                # feedparser stores RSS <description> under "summary"
+                snippet=_field(entry, "summary", ""),
+                url=_field(entry, "link", ""),
+                published=published.isoformat() if published else "",
+                source=_extract_source(entry, title),
+                keyword=keyword,
+                title_key=_digest(title.lower().strip()),
+            )
         )
 
     logger.debug("Keyword '%s': %d articles", keyword, len(articles))
     return articles
 
 
+@functools.lru_cache(maxsize=8192)
 def _normalize_url(url: str) -> str:
-    """Normalize URL for deduplication: strip tracking params, lowercase host."""
+    """Normalize URL for deduplication: strip tracking params, lowercase host.
+
+    Cached, since the same URL often turns up under several keywords.
+    """
     parsed = urlparse(url)
     hostname = (parsed.hostname or "").lower()
 
-    if parsed.query:
-        params = parse_qs(parsed.query)
+    # Cheap substring test first — most queries carry no tracking params,
+    # and those can skip the parse_qs/urlencode round-trip
+    query = parsed.query
+    if query and any(p in query for p in _TRACKING_PREFIXES):
+        params = parse_qs(query)
         cleaned = {k: v for k, v in params.items() if k not in _TRACKING_PARAMS}
         query = urlencode(cleaned, doseq=True)
-    else:
-        query = ""
 
     path = parsed.path.rstrip("/")
     return f"{parsed.scheme}://{hostname}{path}{'?' + query if query else ''}"
 
 
+def _digest(key: str) -> int:
+    """Hash a dedup key to a 64-bit int.
+
+    Seen-sets hold one small int per URL/title instead of the full string;
+    collisions are negligible at feed scale.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
 def _parse_date(entry) -> datetime | None:
     """Parse entry publication date to timezone-aware datetime."""
-    if entry.get("published_parsed"):
-        timestamp = calendar.timegm(entry.published_parsed)
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    parsed = _field(entry, "published_parsed")
+    if parsed:
+        # feedparser's struct_time is already UTC; build the datetime directly
+        # rather than round-tripping through epoch seconds
+        try:
+            return datetime(*parsed[:6], tzinfo=UTC)
+        except ValueError:
+            # Leap seconds and other out-of-range fields; fall through to the raw string
+            pass
 
-    if entry.get("published"):
+    published = _field(entry, "published")
+    if published:
         try:
-            return parsedate_to_datetime(entry.published)
+            return parsedate_to_datetime(published)
         except (ValueError, TypeError):
             pass
 
@@ -177,8 +335,8 @@ def _extract_source(entry, title: str) -> str:
 
     Google News RSS includes the source after the last ' - ' in the title.
     """
-    source = entry.get("source", {})
-    if isinstance(source, dict) and source.get("title"):
+    source = _field(entry, "source")
+    if isinstance(source, dict) and _field(source, "title"):
         return source["title"]
 
     if " - " in title:
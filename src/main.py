@@ -5,11 +5,14 @@ keywords, prompt, and field mappings under subjects/<name>/.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 # Ensure project root is on sys.path so `python src/main.py` works
@@ -17,6 +20,7 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+import orjson  # noqa: E402
 from dotenv import load_dotenv  # noqa: E402
 
 from src.analyzer import analyze_articles  # noqa: E402
@@ -29,14 +33,23 @@ from src.dedup import deduplicate_articles, get_dedup_stats  # noqa: E402
 from src.dedup_history import load_seen_urls  # noqa: E402
 from src.enrichment import enrich_articles, get_enrichment_stats  # noqa: E402
 from src.fetcher import fetch_all_articles  # noqa: E402
-from src.reporter import generate_report  # noqa: E402
+from src.reporter import generate_report, get_environment, mark_kept  # noqa: E402
 from src.subject_loader import list_subjects, load_subject  # noqa: E402
-from src.telegram_bot import TelegramDelivery  # noqa: E402
+from src.telegram_bot import (  # noqa: E402
+    AsyncTelegramDelivery,
+    SummaryItem,
+    TelegramDelivery,
+    summary_items,
+)
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = _PROJECT_ROOT
 
+# Run logs and opportunity exports stay human-readable (indent=2). Non-str
+# keys (e.g. a null noise_flag in noise_distribution) serialize like json.dumps
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging format and level."""
@@ -57,26 +70,39 @@ def save_run_log(log_data: dict, subject_slug: str = "") -> Path:
     log_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.json"
     log_path = log_dir / filename
-    log_path.write_text(json.dumps(log_data, indent=2, default=str), encoding="utf-8")
+    log_path.write_bytes(orjson.dumps(log_data, option=_JSON_OPTIONS, default=str))
     return log_path
 
 
 def _get_telegram_bot(
-    subject_name: str = "Monitor", subject_emoji: str = ""
-) -> TelegramDelivery | None:
-    """Create TelegramDelivery instance from env vars, or None if missing."""
+    subject_name: str = "Monitor", subject_emoji: str = "",
+    delivery_cls: type[TelegramDelivery | AsyncTelegramDelivery] = TelegramDelivery,
+) -> TelegramDelivery | AsyncTelegramDelivery | None:
+    """Create a Telegram delivery instance from env vars, or None if missing.
+
+    Pass delivery_cls=AsyncTelegramDelivery for the async client.
+    """
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     chat_id = os.getenv("TELEGRAM_CHAT_ID")
     if not token or not chat_id:
         logger.error("TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID not set in .env")
         return None
-    return TelegramDelivery(token, chat_id,
-                            subject_name=subject_name, subject_emoji=subject_emoji)
+    return delivery_cls(token, chat_id,
+                        subject_name=subject_name, subject_emoji=subject_emoji)
+
+
+async def _deliver_run(
+    bot: AsyncTelegramDelivery, kept: list[dict], stats: dict,
+    report_path: Path | None,
+) -> None:
+    """Send a run's Telegram messages, closing the client afterwards."""
+    async with bot:
+        await bot.send_all(summary_items(kept), stats, report_path)
 
 
 def run_pipeline(
     subject: dict, days_override: int | None = None, dry_run: bool = False,
-    use_batch_api: bool = False, skip_enrichment: bool = False,
+    dispatch_mode: str = "auto", skip_enrichment: bool = False,
     limit: int | None = None, skip_dedup: bool = False,
     dedup_threshold: float = 0.80, no_history_dedup: bool = False,
 ) -> dict:
@@ -134,15 +160,16 @@ def run_pipeline(
         if not dry_run and config.get("telegram_enabled"):
             bot = _get_telegram_bot(subject_name, subject_emoji)
             if bot:
-                try:
-                    bot._send_message(
-                        f"{bot._header(date_str)}\n\n"
-                        f"0 articles fetched from Google News.\n"
-                        f"Possible rate-limit or connectivity issue.\n"
-                        f"Check RSS feeds manually."
-                    )
-                except Exception as e:
-                    logger.error("Telegram delivery failed: %s", e)
+                with bot:
+                    try:
+                        bot._send_message(
+                            f"{bot._header(date_str)}\n\n"
+                            f"0 articles fetched from Google News.\n"
+                            f"Possible rate-limit or connectivity issue.\n"
+                            f"Check RSS feeds manually."
+                        )
+                    except Exception as e:
+                        logger.error("Telegram delivery failed: %s", e)
 
         run_data["end_time"] = datetime.now().isoformat()
         return run_data
@@ -203,20 +230,19 @@ def run_pipeline(
         model=model,
         extra_fields=extra_fields,
         subject_slug=subject_slug,
-        use_batch_api=use_batch_api,
+        dispatch_mode=dispatch_mode,
     )
     run_data["articles_analyzed"] = len(analyzed)
     run_data["token_usage"] = token_usage
 
     min_score = config.get("min_opportunity_score", 5)
 
+    mark_kept(analyzed, min_score)
+
     # --- CROSS-DAY DEDUP ---
     if not no_history_dedup:
         seen_urls = load_seen_urls([subject_slug])
-        pre_dedup = [
-            a for a in analyzed
-            if a.get("decision") == "KEEP" and a.get("score", 0) >= min_score
-        ]
+        pre_dedup = [a for a in analyzed if a["_keep"]]
         kept = [
             a for a in pre_dedup
             if a.get("source_url", a.get("url", "")) not in seen_urls
@@ -229,13 +255,10 @@ def run_pipeline(
             )
         run_data["history_dedup_suppressed"] = history_suppressed
     else:
-        kept = [
-            a
-            for a in analyzed
-            if a.get("decision") == "KEEP" and a.get("score", 0) >= min_score
-        ]
-    killed = [a for a in analyzed if a not in kept]
-    kept.sort(key=lambda a: a.get("score", 0), reverse=True)
+        kept = [a for a in analyzed if a["_keep"]]
+    kept_ids = {id(a) for a in kept}
+    killed = [a for a in analyzed if id(a) not in kept_ids]
+    kept.sort(key=itemgetter("_score"), reverse=True)
 
     run_data["articles_kept"] = len(kept)
     run_data["articles_killed"] = len(killed)
@@ -300,15 +323,16 @@ def run_pipeline(
                 for field_spec in custom_fields["extra_fields"]:
                     field_name = field_spec["field"]
                     opp[field_name] = article.get(field_name, "")
-        json_path.write_text(json.dumps(opportunities, indent=2), encoding="utf-8")
+        json_path.write_bytes(orjson.dumps(opportunities, option=_JSON_OPTIONS))
         run_data["opportunities_json"] = str(json_path)
         logger.info("[%s] Saved %d opportunities to %s", subject_slug, len(kept), json_path)
 
     # --- DELIVER VIA TELEGRAM ---
     if config.get("telegram_enabled"):
-        bot = _get_telegram_bot(subject_name, subject_emoji)
+        bot = _get_telegram_bot(subject_name, subject_emoji,
+                                delivery_cls=AsyncTelegramDelivery)
         if bot:
-            high_priority = sum(1 for a in kept if a.get("score", 0) >= 8)
+            high_priority = sum(1 for a in kept if a["_score"] >= 8)
             stats = {
                 "date": date_str,
                 "total_scanned": len(articles),
@@ -318,12 +342,7 @@ def run_pipeline(
             }
 
             try:
-                if kept:
-                    bot.send_summary(kept, stats)
-                    if report_path and report_path.exists():
-                        bot.send_report(report_path)
-                else:
-                    bot.send_no_results(stats)
+                asyncio.run(_deliver_run(bot, kept, stats, report_path))
             except Exception as e:
                 logger.error("Telegram delivery failed: %s", e)
                 run_data["errors"].append(f"Telegram: {e}")
@@ -336,8 +355,6 @@ def run_pipeline(
 
 def run_cross_signal(date: str | None = None, dry_run: bool = False) -> None:
     """Run cross-subject signal detection and generate report."""
-    from jinja2 import Environment, FileSystemLoader
-
     if not date:
         date = datetime.now().strftime("%Y-%m-%d")
 
@@ -375,46 +392,42 @@ def run_cross_signal(date: str | None = None, dry_run: bool = False) -> None:
 
     # Generate HTML report
     template_path = PROJECT_ROOT / "templates" / "cross_signal_report.html"
-    env = Environment(
-        loader=FileSystemLoader(str(template_path.parent)), autoescape=True
-    )
-    template = env.get_template(template_path.name)
-
-    html = template.render(
-        date=date,
-        cross_signals=cross_signals,
-    )
+    template = get_environment(str(template_path.parent)).get_template(template_path.name)
 
     report_dir = PROJECT_ROOT / "reports" / "cross-signals"
     report_dir.mkdir(parents=True, exist_ok=True)
     report_path = report_dir / f"{date}.html"
-    report_path.write_text(html, encoding="utf-8")
+    template.stream(
+        date=date,
+        cross_signals=cross_signals,
+    ).dump(str(report_path), encoding="utf-8")
     logger.info("Cross-signal report: %s", report_path)
     print(f"Cross-signal report: {report_path}")
 
     # Send via Telegram
     bot = _get_telegram_bot("Cross-Signal", "")
     if bot:
-        try:
-            stats = {
-                "date": date,
-                "total_scanned": len(infra_opps) + len(rezone_opps),
-                "kept_count": len(cross_signals),
-                "killed_count": 0,
-            }
-            if cross_signals:
-                bot.send_summary(
-                    [{"headline": cs["cross_signal_narrative"][:100],
-                      "score": cs["cross_signal_score"],
-                      "city": cs["city"], "state": cs["state"]}
-                     for cs in cross_signals],
-                    stats,
-                )
-                bot.send_report(report_path)
-            else:
-                bot.send_no_results(stats)
-        except Exception as e:
-            logger.error("Cross-signal Telegram delivery failed: %s", e)
+        with bot:
+            try:
+                stats = {
+                    "date": date,
+                    "total_scanned": len(infra_opps) + len(rezone_opps),
+                    "kept_count": len(cross_signals),
+                    "killed_count": 0,
+                }
+                if cross_signals:
+                    bot.send_summary(
+                        [SummaryItem(headline=cs["cross_signal_narrative"][:100],
+                                     score=cs["cross_signal_score"],
+                                     city=cs["city"], state=cs["state"])
+                         for cs in cross_signals],
+                        stats,
+                    )
+                    bot.send_report(report_path)
+                else:
+                    bot.send_no_results(stats)
+            except Exception as e:
+                logger.error("Cross-signal Telegram delivery failed: %s", e)
 
     print(f"\nCross-signal complete: {len(cross_signals)} signals found")
 
@@ -525,11 +538,12 @@ def run_weekly_summary() -> None:
 
     bot = _get_telegram_bot("Weekly Summary", "")
     if bot:
-        try:
-            bot._send_message(text)
-            logger.info("Weekly summary sent to Telegram")
-        except Exception as e:
-            logger.error("Failed to send weekly summary: %s", e)
+        with bot:
+            try:
+                bot._send_message(text)
+                logger.info("Weekly summary sent to Telegram")
+            except Exception as e:
+                logger.error("Failed to send weekly summary: %s", e)
     else:
         print(text)
 
@@ -540,7 +554,8 @@ def test_telegram() -> None:
     if not bot:
         sys.exit(1)
 
-    success = bot.send_test()
+    with bot:
+        success = bot.send_test()
     if success:
         logger.info("Test message sent successfully")
     else:
@@ -548,6 +563,37 @@ def test_telegram() -> None:
         sys.exit(1)
 
 
+def _run_one_subject(slug: str, pipeline_kwargs: dict) -> dict:
+    """Load, run, and log a single subject. Returns the run summary dict.
+
+    Module-level so --parallel-subjects workers can pickle it.
+    """
+    subject = load_subject(slug)
+    run_data = run_pipeline(subject, **pipeline_kwargs)
+    log_path = save_run_log(run_data, subject_slug=slug)
+    logger.info("[%s] Run log saved to %s", slug, log_path)
+    return run_data
+
+
+def _report_subject_run(slug: str, run_data: dict) -> bool:
+    """Print a subject's run summary. Returns True if the run had errors."""
+    print(
+        f"\n[{slug}] Pipeline complete: "
+        f"{run_data.get('articles_fetched', 0)} fetched, "
+        f"{run_data.get('articles_kept', 0)} kept, "
+        f"{run_data.get('articles_killed', 0)} killed"
+    )
+
+    if run_data.get("report_path"):
+        print(f"[{slug}] Report: {run_data['report_path']}")
+
+    if run_data.get("errors"):
+        logger.warning("[%s] Completed with %d errors",
+                       slug, len(run_data["errors"]))
+        return True
+    return False
+
+
 def main():
     parser = argparse.ArgumentParser(description="Monitoring Pipeline")
     parser.add_argument(
@@ -559,7 +605,16 @@ def main():
     parser.add_argument(
         "--all-subjects",
         action="store_true",
-        help="Run all available subjects sequentially",
+        help="Run all available subjects (sequentially unless --parallel-subjects is set)",
+    )
+    parser.add_argument(
+        "--parallel-subjects",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --all-subjects, run up to N subjects in separate processes "
+             "(default: 1, sequential). Each process holds its own model and "
+             "hits Google News concurrently, so keep N small",
     )
     parser.add_argument(
         "--list-subjects",
@@ -582,10 +637,21 @@ def main():
         action="store_true",
         help="Send a test message to Telegram and exit",
     )
-    parser.add_argument(
+    dispatch_group = parser.add_mutually_exclusive_group()
+    dispatch_group.add_argument(
         "--batch-api",
-        action="store_true",
-        help="Use Messages Batch API (50%% cheaper, async processing)",
+        action="store_const",
+        const="batch",
+        dest="dispatch_mode",
+        help="Always use Messages Batch API (50%% cheaper, async processing)",
+    )
+    dispatch_group.add_argument(
+        "--sync-api",
+        action="store_const",
+        const="sync",
+        dest="dispatch_mode",
+        help="Always use the synchronous Messages API (default: Batch API "
+             "for runs larger than two batches)",
     )
     parser.add_argument(
         "--skip-enrichment",
@@ -635,6 +701,7 @@ def main():
         action="store_true",
         help="Enable DEBUG logging",
     )
+    parser.set_defaults(dispatch_mode="auto")
     args = parser.parse_args()
 
     setup_logging(args.verbose)
@@ -677,48 +744,52 @@ def main():
             logger.error("No subjects found in subjects/ directory")
             sys.exit(1)
 
+        pipeline_kwargs = {
+            "days_override": args.days,
+            "dry_run": args.dry_run,
+            "dispatch_mode": args.dispatch_mode,
+            "skip_enrichment": args.skip_enrichment,
+            "limit": args.limit,
+            "skip_dedup": args.skip_dedup,
+            "dedup_threshold": args.dedup_threshold,
+            "no_history_dedup": args.no_history_dedup,
+        }
+        slugs = [s["slug"] for s in subjects]
+        workers = min(args.parallel_subjects, len(slugs))
+
         any_failed = False
-        for s in subjects:
-            slug = s["slug"]
-            logger.info("=" * 60)
-            logger.info("Running subject: %s", slug)
-            logger.info("=" * 60)
-            try:
-                subject = load_subject(slug)
-                run_data = run_pipeline(
-                    subject, days_override=args.days, dry_run=args.dry_run,
-                    use_batch_api=args.batch_api,
-                    skip_enrichment=args.skip_enrichment,
-                    limit=args.limit,
-                    skip_dedup=args.skip_dedup,
-                    dedup_threshold=args.dedup_threshold,
-                    no_history_dedup=args.no_history_dedup,
-                )
-                log_path = save_run_log(run_data, subject_slug=slug)
-                logger.info("[%s] Run log saved to %s", slug, log_path)
-
-                print(
-                    f"\n[{slug}] Pipeline complete: "
-                    f"{run_data.get('articles_fetched', 0)} fetched, "
-                    f"{run_data.get('articles_kept', 0)} kept, "
-                    f"{run_data.get('articles_killed', 0)} killed"
-                )
-
-                if run_data.get("report_path"):
-                    print(f"[{slug}] Report: {run_data['report_path']}")
-
-                if run_data.get("errors"):
-                    logger.warning("[%s] Completed with %d errors",
-                                   slug, len(run_data["errors"]))
-                    any_failed = True
-
-            except KeyboardInterrupt:
-                logger.info("Pipeline interrupted by user")
-                sys.exit(130)
-            except Exception as e:
-                logger.exception("[%s] Pipeline failed: %s", slug, e)
-                any_failed = True
-                continue  # Continue to next subject
+        try:
+            if workers > 1:
+                logger.info("Running %d subjects across %d processes", len(slugs), workers)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_run_one_subject, slug, pipeline_kwargs)
+                        for slug in slugs
+                    ]
+                    for slug, future in zip(slugs, futures):
+                        try:
+                            run_data = future.result()
+                        except Exception as e:
+                            logger.exception("[%s] Pipeline failed: %s", slug, e)
+                            any_failed = True
+                            continue
+                        any_failed |= _report_subject_run(slug, run_data)
+            else:
+                for slug in slugs:
+                    logger.info("=" * 60)
+                    logger.info("Running subject: %s", slug)
+                    logger.info("=" * 60)
+                    try:
+                        run_data = _run_one_subject(slug, pipeline_kwargs)
+                    except Exception as e:
+                        logger.exception("[%s] Pipeline failed: %s", slug, e)
+                        any_failed = True
+                        continue  # Continue to next subject
+                    any_failed |= _report_subject_run(slug, run_data)
+
+        except KeyboardInterrupt:
+            logger.info("Pipeline interrupted by user")
+            sys.exit(130)
 
         if any_failed:
             sys.exit(1)
@@ -729,7 +800,7 @@ def main():
         subject = load_subject(args.subject)
         run_data = run_pipeline(
             subject, days_override=args.days, dry_run=args.dry_run,
-            use_batch_api=args.batch_api,
+            dispatch_mode=args.dispatch_mode,
             skip_enrichment=args.skip_enrichment,
             limit=args.limit,
             skip_dedup=args.skip_dedup,
@@ -1,14 +1,49 @@
 """HTML report generator using Jinja2 templates — subject-agnostic."""
 
+import functools
 import logging
 from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 logger = logging.getLogger(__name__)
 
+# Compiled template bytecode, reused across runs (keyed by template source checksum)
+_JINJA_CACHE_DIR = Path(__file__).parent.parent / ".jinja_cache"
+
+
+@functools.lru_cache(maxsize=16)
+def get_environment(template_dir: str) -> Environment:
+    """Return a shared Jinja2 environment for templates in *template_dir*.
+
+    Templates are compiled once per process and their bytecode is cached on
+    disk, so later runs skip lexing and parsing. auto_reload is off since a
+    run never outlives a template edit.
+    """
+    _JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(str(_JINJA_CACHE_DIR)),
+        auto_reload=False,
+    )
+
+
+def mark_kept(articles: list[dict], min_score: int) -> None:
+    """Annotate analyzed articles in place with ``_score`` and ``_keep``.
+
+    ``_score`` is the numeric score (missing/null -> 0) and ``_keep`` whether
+    the article is a KEEP at or above *min_score*, so callers filter and sort
+    on plain lookups instead of repeating ``.get()`` defaults.
+    """
+    for a in articles:
+        score = a.get("score") or 0
+        a["_score"] = score
+        a["_keep"] = a.get("decision") == "KEEP" and score >= min_score
+
 
 def generate_report(
     analyzed_articles: list[dict],
@@ -35,16 +70,14 @@ def generate_report(
         logger.warning("No analyzed articles to report on")
         return None
 
-    # Split kept/killed
-    kept = [
-        a
-        for a in analyzed_articles
-        if a.get("decision") == "KEEP" and a.get("score", 0) >= min_score
-    ]
-    killed = [a for a in analyzed_articles if a not in kept]
+    # Split kept/killed in a single pass
+    mark_kept(analyzed_articles, min_score)
+    kept, killed = [], []
+    for a in analyzed_articles:
+        (kept if a["_keep"] else killed).append(a)
 
     # Sort kept by score descending
-    kept.sort(key=lambda a: a.get("score", 0), reverse=True)
+    kept.sort(key=itemgetter("_score"), reverse=True)
 
     # Classification breakdown for kept articles
     classification_counts = dict(Counter(a.get("classification", "") for a in kept))
@@ -53,10 +86,7 @@ def generate_report(
     if template_path is None:
         template_path = Path(__file__).parent.parent / "templates" / "default_report.html"
 
-    template_dir = template_path.parent
-    template_name = template_path.name
-    env = Environment(loader=FileSystemLoader(str(template_dir)), autoescape=True)
-    template = env.get_template(template_name)
+    template = get_environment(str(template_path.parent)).get_template(template_path.name)
 
     now = datetime.now()
     date_str = now.strftime("%Y-%m-%d")
@@ -64,7 +94,17 @@ def generate_report(
     # Extract change_block for template
     change_block = (custom_fields or {}).get("change_block")
 
-    html = template.render(
+    # Save report to reports/<subject>/
+    project_root = Path(__file__).parent.parent
+    if subject_slug:
+        out_dir = project_root / "reports" / subject_slug
+    else:
+        out_dir = project_root / "reports"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    report_path = out_dir / f"{date_str}.html"
+
+    # Stream rendered chunks straight to disk rather than building one big string
+    template.stream(
         date=date_str,
         subject_name=subject_name,
         scanned_count=len(analyzed_articles),
@@ -75,17 +115,7 @@ def generate_report(
         killed_articles=killed,
         change_block=change_block,
         generated_at=now.strftime("%Y-%m-%d %H:%M:%S"),
-    )
-
-    # Save report to reports/<subject>/
-    project_root = Path(__file__).parent.parent
-    if subject_slug:
-        out_dir = project_root / "reports" / subject_slug
-    else:
-        out_dir = project_root / "reports"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    report_path = out_dir / f"{date_str}.html"
-    report_path.write_text(html, encoding="utf-8")
+    ).dump(str(report_path), encoding="utf-8")
 
     logger.info(
         "Report saved to %s (%d kept, %d killed)", report_path, len(kept), len(killed)
@@ -24,6 +24,36 @@ _GLOBAL_DEFAULTS = {
     "days_lookback": 1,
 }
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed file contents keyed by path, tagged with the st_mtime_ns they were read at
+_file_cache: dict[Path, tuple[int, object]] = {}
+
+
+def _read_cached(path: Path, parse) -> object:
+    """Return parse(text of *path*), re-reading only when its mtime changes.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    value = parse(path.read_text(encoding="utf-8"))
+    _file_cache[path] = (mtime_ns, value)
+    return value
+
+
+def _parse_yaml(text: str) -> dict:
+    return yaml.load(text, Loader=_YAML_LOADER) or {}
+
+
+def _load_yaml(path: Path) -> dict:
+    """Load a YAML mapping from *path* via the mtime cache."""
+    return _read_cached(path, _parse_yaml)
+
 
 def _load_global_config() -> dict:
     """Load the global config.yaml with defaults."""
@@ -31,8 +61,7 @@ def _load_global_config() -> dict:
         logger.warning("Global config not found at %s, using defaults", GLOBAL_CONFIG_PATH)
         return dict(_GLOBAL_DEFAULTS)
 
-    with open(GLOBAL_CONFIG_PATH, encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
+    config = dict(_load_yaml(GLOBAL_CONFIG_PATH))
 
     for key, default in _GLOBAL_DEFAULTS.items():
         config.setdefault(key, default)
@@ -70,8 +99,7 @@ def load_subject(subject_slug: str) -> dict:
         logger.error("Missing subject.yaml in %s", subject_dir)
         sys.exit(1)
 
-    with open(subject_yaml_path, encoding="utf-8") as f:
-        subject_config = yaml.safe_load(f) or {}
+    subject_config = _load_yaml(subject_yaml_path)
 
     # Load prompt.md
     prompt_path = subject_dir / "prompt.md"
@@ -79,7 +107,7 @@ def load_subject(subject_slug: str) -> dict:
         logger.error("Missing prompt.md in %s", subject_dir)
         sys.exit(1)
 
-    system_prompt = prompt_path.read_text(encoding="utf-8")
+    system_prompt = _read_cached(prompt_path, str)
 
     # Determine template path: subject-specific or default
     subject_template = subject_dir / "report.html"
@@ -131,8 +159,7 @@ def list_subjects() -> list[dict]:
         if not subject_yaml.exists():
             continue
 
-        with open(subject_yaml, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(subject_yaml)
 
         subjects.append({
             "slug": entry.name,
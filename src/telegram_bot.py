@@ -1,17 +1,69 @@
-"""Telegram Bot API delivery using raw requests (no SDK) — subject-agnostic."""
+"""Telegram Bot API delivery using raw HTTP (no SDK) — subject-agnostic."""
 
+import asyncio
 import logging
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import Self
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
 
-from src.utils import retry_with_backoff
+from src.utils import HTTP2_AVAILABLE, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# sendMessage bodies are pre-encoded with orjson
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-class TelegramDelivery:
-    """Handles all Telegram message delivery via Bot API."""
+# Kept articles listed in the summary message; the rest are in the report
+_SUMMARY_ARTICLE_LIMIT = 15
+
+# Score marker indexed by "high priority" (score >= 8): yellow, red
+_SCORE_EMOJI = ("\U0001f7e1", "\U0001f534")
+
+# One summary entry; the trailing newline leaves a blank line between entries
+_ARTICLE_FMT = (
+    "{emoji} {score}/10 \u2014 {location}\n{headline}\n{classification}\n\u2192 {stage}\n"
+)
+
+
+@dataclass(slots=True)
+class SummaryItem:
+    """One kept article as listed in the Telegram summary."""
+
+    score: float = 0
+    city: str = ""
+    state: str = ""
+    headline: str = ""
+    classification: str = ""
+    stage: str = ""
+
+
+def summary_items(articles: list[dict]) -> list[SummaryItem]:
+    """Convert analyzed article dicts (sorted by score) into summary entries.
+
+    Only the articles the summary actually lists are converted.
+    """
+    return [
+        SummaryItem(
+            score=a.get("score", 0),
+            city=a.get("city", ""),
+            state=a.get("state", ""),
+            headline=a.get("headline", ""),
+            classification=a.get("classification", ""),
+            stage=a.get("stage", ""),
+        )
+        for a in islice(articles, _SUMMARY_ARTICLE_LIMIT)
+    ]
+
+
+class _TelegramMessages:
+    """Bot credentials and message formatting shared by the sync and async clients."""
 
     def __init__(self, token: str, chat_id: str,
                  subject_name: str = "Monitor", subject_emoji: str = ""):
@@ -21,21 +73,19 @@ class TelegramDelivery:
         self.subject_name = subject_name
         self.subject_emoji = subject_emoji
 
+        # Invariant for the object's lifetime, so built once
+        self._header_prefix = (
+            f"{subject_emoji} {subject_name}" if subject_emoji else subject_name
+        )
+        self._send_message_url = f"{self.base_url}/sendMessage"
+        self._send_document_url = f"{self.base_url}/sendDocument"
+
     def _header(self, date: str) -> str:
         """Build the message header line."""
-        prefix = f"{self.subject_emoji} " if self.subject_emoji else ""
-        return f"{prefix}{self.subject_name} \u2014 {date}"
-
-    def send_summary(
-        self, kept_articles: list[dict], stats: dict
-    ) -> bool:
-        """Send formatted summary text message with emoji score indicators.
+        return f"{self._header_prefix} \u2014 {date}"
 
-        Args:
-            kept_articles: List of KEEP articles sorted by score desc.
-            stats: Dict with total_scanned, kept_count, killed_count,
-                   high_priority_count keys.
-        """
+    def _format_summary(self, items: list[SummaryItem], stats: dict) -> str:
+        """Build the summary text: run stats, then the top 15 kept articles."""
         total = stats.get("total_scanned", 0)
         kept_count = stats.get("kept_count", 0)
         killed = stats.get("killed_count", 0)
@@ -50,38 +100,28 @@ class TelegramDelivery:
             "",
         ]
 
-        for article in kept_articles[:15]:
-            score = article.get("score", 0)
-            emoji = "\U0001f534" if score >= 8 else "\U0001f7e1"
-            city = article.get("city", "")
-            state = article.get("state", "")
-            location = f"{city}, {state}" if city and state else city or state
-            headline = article.get("headline", "")[:80]
-            classification = article.get("classification", "")
-            stage = article.get("stage", "")
-
-            lines.append(f"{emoji} {score}/10 \u2014 {location}")
-            lines.append(headline)
-            lines.append(classification)
-            lines.append(f"\u2192 {stage}")
-            lines.append("")
+        for item in islice(items, _SUMMARY_ARTICLE_LIMIT):
+            city, state = item.city, item.state
+            lines.append(_ARTICLE_FMT.format(
+                emoji=_SCORE_EMOJI[item.score >= 8],
+                score=item.score,
+                location=f"{city}, {state}" if city and state else city or state,
+                headline=item.headline[:80],
+                classification=item.classification,
+                stage=item.stage,
+            ))
 
         lines.append("---")
         lines.append("Full report attached \u2193")
 
-        text = "\n".join(lines)
-        return self._send_message(text)
+        return "\n".join(lines)
 
-    def send_no_results(self, stats: dict) -> bool:
-        """Send 'no opportunities found' message.
-
-        Args:
-            stats: Dict with total_scanned and killed_count keys.
-        """
+    def _format_no_results(self, stats: dict) -> str:
+        """Build the 'no opportunities found' text."""
         total = stats.get("total_scanned", 0)
         killed = stats.get("killed_count", 0)
 
-        text = (
+        return (
             f"{self._header(stats.get('date', 'today'))}\n"
             f"\n"
             f"Scanned: {total} articles\n"
@@ -89,7 +129,62 @@ class TelegramDelivery:
             f"\n"
             f"All {killed} articles were filtered out."
         )
-        return self._send_message(text)
+
+    def _format_test(self) -> str:
+        """Build the setup-check message."""
+        return (
+            f"{self._header('Test message')}\n\n"
+            "Telegram delivery is working correctly."
+        )
+
+    def _default_caption(self) -> str:
+        return f"Daily {self.subject_name} Report"
+
+
+class TelegramDelivery(_TelegramMessages):
+    """Handles all Telegram message delivery via Bot API."""
+
+    def __init__(self, token: str, chat_id: str,
+                 subject_name: str = "Monitor", subject_emoji: str = ""):
+        super().__init__(token, chat_id, subject_name, subject_emoji)
+
+        # One keep-alive connection pool for every call in a run; retries are
+        # handled by retry_with_backoff, not urllib3
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def send_summary(
+        self, items: list[SummaryItem], stats: dict
+    ) -> bool:
+        """Send formatted summary text message with emoji score indicators.
+
+        Args:
+            items: Summary entries for KEEP articles sorted by score desc
+                   (see summary_items()).
+            stats: Dict with total_scanned, kept_count, killed_count,
+                   high_priority_count keys.
+        """
+        return self._send_message(self._format_summary(items, stats))
+
+    def send_no_results(self, stats: dict) -> bool:
+        """Send 'no opportunities found' message.
+
+        Args:
+            stats: Dict with total_scanned and killed_count keys.
+        """
+        return self._send_message(self._format_no_results(stats))
 
     @retry_with_backoff(
         max_retries=2,
@@ -103,16 +198,17 @@ class TelegramDelivery:
             report_path: Path to the HTML report file.
             caption: Optional caption for the document.
         """
-        url = f"{self.base_url}/sendDocument"
-        default_caption = f"Daily {self.subject_name} Report"
         with open(report_path, "rb") as f:
-            resp = requests.post(
-                url,
-                data={
-                    "chat_id": self.chat_id,
-                    "caption": caption or default_caption,
-                },
-                files={"document": (report_path.name, f, "text/html")},
+            # Stream the multipart body from disk instead of building it in memory
+            encoder = MultipartEncoder(fields={
+                "chat_id": self.chat_id,
+                "caption": caption or self._default_caption(),
+                "document": (report_path.name, f, "text/html"),
+            })
+            resp = self.session.post(
+                self._send_document_url,
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
                 timeout=30,
             )
 
@@ -129,10 +225,7 @@ class TelegramDelivery:
 
     def send_test(self) -> bool:
         """Send a test message to verify Telegram setup."""
-        return self._send_message(
-            f"{self._header('Test message')}\n\n"
-            "Telegram delivery is working correctly."
-        )
+        return self._send_message(self._format_test())
 
     @retry_with_backoff(
         max_retries=2,
@@ -141,14 +234,116 @@ class TelegramDelivery:
     )
     def _send_message(self, text: str) -> bool:
         """Send a text message via Telegram Bot API."""
-        url = f"{self.base_url}/sendMessage"
-        resp = requests.post(
-            url,
-            json={
+        resp = self.session.post(
+            self._send_message_url,
+            data=orjson.dumps({"chat_id": self.chat_id, "text": text}),
+            headers=_JSON_HEADERS,
+            timeout=15,
+        )
+
+        if resp.status_code != 200:
+            logger.error(
+                "Telegram sendMessage failed: %s %s",
+                resp.status_code,
+                resp.text[:200],
+            )
+            return False
+
+        return True
+
+
+class AsyncTelegramDelivery(_TelegramMessages):
+    """Async Telegram delivery over one pooled httpx client (HTTP/2 when h2 is installed).
+
+    Use as ``async with AsyncTelegramDelivery(...) as bot:`` so the client is
+    closed when delivery finishes.
+    """
+
+    def __init__(self, token: str, chat_id: str,
+                 subject_name: str = "Monitor", subject_emoji: str = ""):
+        super().__init__(token, chat_id, subject_name, subject_emoji)
+        self.client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=15)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def send_all(
+        self, items: list[SummaryItem], stats: dict, report_path: Path | None = None
+    ) -> bool:
+        """Deliver a run's results: summary then report, or the no-results note.
+
+        The report follows the summary rather than racing it, since the summary
+        ends with "Full report attached" and chats show messages in arrival order.
+        Returns True only if every message was accepted.
+        """
+        if not items:
+            return await self.send_no_results(stats)
+
+        ok = await self.send_summary(items, stats)
+        if report_path and await asyncio.to_thread(report_path.exists):
+            ok = await self.send_report(report_path) and ok
+        return ok
+
+    async def send_summary(self, items: list[SummaryItem], stats: dict) -> bool:
+        """Send formatted summary text message with emoji score indicators."""
+        return await self._send_message(self._format_summary(items, stats))
+
+    async def send_no_results(self, stats: dict) -> bool:
+        """Send 'no opportunities found' message."""
+        return await self._send_message(self._format_no_results(stats))
+
+    async def send_test(self) -> bool:
+        """Send a test message to verify Telegram setup."""
+        return await self._send_message(self._format_test())
+
+    @retry_with_backoff(
+        max_retries=2,
+        base_delay=3.0,
+        exceptions=(httpx.HTTPError,),
+    )
+    async def send_report(self, report_path: Path, caption: str = "") -> bool:
+        """Send HTML report as a document attachment."""
+        # Read off the event loop; a blocking open() would stall other sends
+        document = await asyncio.to_thread(report_path.read_bytes)
+        resp = await self.client.post(
+            self._send_document_url,
+            data={
                 "chat_id": self.chat_id,
-                "text": text,
+                "caption": caption or self._default_caption(),
             },
-            timeout=15,
+            files={"document": (report_path.name, document, "text/html")},
+            timeout=30,
+        )
+
+        if resp.status_code != 200:
+            logger.error(
+                "Telegram sendDocument failed: %s %s",
+                resp.status_code,
+                resp.text[:200],
+            )
+            return False
+
+        logger.info("Report sent to Telegram: %s", report_path.name)
+        return True
+
+    @retry_with_backoff(
+        max_retries=2,
+        base_delay=3.0,
+        exceptions=(httpx.HTTPError,),
+    )
+    async def _send_message(self, text: str) -> bool:
+        """Send a text message via Telegram Bot API."""
+        resp = await self.client.post(
+            self._send_message_url,
+            content=orjson.dumps({"chat_id": self.chat_id, "text": text}),
+            headers=_JSON_HEADERS,
         )
 
         if resp.status_code != 200:
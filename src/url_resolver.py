@@ -3,77 +3,129 @@
 import base64
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 from googlenewsdecoder import gnewsdecoder
 
 logger = logging.getLogger(__name__)
 
-# Pattern to identify Google News RSS article URLs
-_GNEWS_ARTICLE_PATTERN = re.compile(
-    r"^https?://news\.google\.com/rss/articles/(.+)"
+# Prefixes that identify Google News RSS article URLs
+_GNEWS_PREFIXES = (
+    "https://news.google.com/rss/articles/",
+    "http://news.google.com/rss/articles/",
 )
 
+# Pattern to find an embedded URL in a decoded protobuf payload. Matched on
+# the raw bytes and limited to printable ASCII, so the protobuf field tag
+# that follows the URL (often a high byte) is never swallowed into it.
+_EMBEDDED_URL_PATTERN = re.compile(rb'https?://[^\x00-\x20"<>\x7f-\xff]+')
+
+# Successful resolutions for this process, so a story that turns up again
+# (e.g. under another subject in --all-subjects) skips both tiers. Failures
+# aren't cached: a Tier 2 miss may be transient.
+_resolved_cache: dict[str, str] = {}
+
 
 def resolve_url(url: str) -> str:
     """Resolve a Google News RSS URL to the actual article URL.
 
     Tries fast base64 protobuf decode first (works for older-format URLs),
     then falls back to googlenewsdecoder (uses Google's batchexecute API).
-    Returns the original URL if both methods fail.
+    Returns the original URL if both methods fail (a warning is logged by
+    resolve_url_map()).
     """
-    match = _GNEWS_ARTICLE_PATTERN.match(url)
-    if not match:
+    if _gnews_payload(url) is None:
         return url  # Not a Google News URL, return as-is
+    return resolve_url_map([url]).get(url, url)
 
-    encoded_payload = match.group(1)
-
-    # Strip query string from the payload (e.g., ?oc=5)
-    if "?" in encoded_payload:
-        encoded_payload = encoded_payload.split("?", 1)[0]
-
-    # Tier 1: Try fast base64 protobuf decode (zero network cost, older URLs)
-    decoded_url = _decode_gnews_url(encoded_payload)
-    if decoded_url:
-        return decoded_url
-
-    # Tier 2: Use googlenewsdecoder (newer encrypted URLs)
-    resolved = _resolve_via_decoder(url)
-    if resolved:
-        return resolved
-
-    logger.warning("Could not resolve Google News URL: %s", url[:80])
-    return url  # Graceful fallback to original
 
-
-def resolve_urls(articles: list[dict]) -> list[dict]:
+def resolve_urls(articles: list[dict], max_workers: int = 4) -> list[dict]:
     """Resolve Google News URLs for a batch of articles in-place.
 
     Updates the 'url' field with the resolved URL and stores the
-    original Google News URL in 'original_google_url'.
+    original Google News URL in 'original_google_url'. See
+    resolve_url_map() for how *max_workers* is used.
 
     Returns the same list for chaining.
     """
-    resolved_count = 0
-    failed_count = 0
-
+    resolved = resolve_url_map(
+        [article.get("url", "") for article in articles], max_workers=max_workers
+    )
     for article in articles:
         original = article.get("url", "")
-        if _GNEWS_ARTICLE_PATTERN.match(original):
-            resolved = resolve_url(original)
-            if resolved != original:
-                article["original_google_url"] = original
-                article["url"] = resolved
-                resolved_count += 1
-            else:
-                failed_count += 1
+        target = resolved.get(original)
+        if target:
+            article["original_google_url"] = original
+            article["url"] = target
+    return articles
+
+
+def resolve_url_map(urls: list[str], max_workers: int = 4) -> dict[str, str]:
+    """Resolve the Google News URLs among *urls*.
+
+    Each distinct Google News URL is resolved once per process (see
+    _resolved_cache). The Tier 1 base64
+    decode is pure CPU and runs inline; only URLs it can't decode go to the
+    network-bound googlenewsdecoder fallback, on a pool of *max_workers*
+    threads (kept small, since every call hits the same Google endpoint).
+
+    Returns a mapping of original -> resolved URL for those that resolved;
+    URLs that are not Google News links, or could not be resolved, are absent.
+    """
+    resolved_map = {}
+    pending = []
+    cached_count = tier1_count = 0
+    for url in dict.fromkeys(urls):
+        encoded_payload = _gnews_payload(url)
+        if encoded_payload is None:
+            continue
+        cached = _resolved_cache.get(url)
+        if cached:
+            resolved_map[url] = cached
+            cached_count += 1
+            continue
+        decoded_url = _decode_gnews_url(encoded_payload)
+        if decoded_url:
+            resolved_map[url] = _resolved_cache[url] = decoded_url
+            tier1_count += 1
+        else:
+            pending.append(url)
+
+    failed_count = 0
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for url, resolved in zip(pending, executor.map(_resolve_via_decoder, pending)):
+                if resolved:
+                    resolved_map[url] = _resolved_cache[url] = resolved
+                else:
+                    logger.warning("Could not resolve Google News URL: %s", url[:80])
+                    failed_count += 1
 
     logger.info(
-        "URL resolution: %d resolved, %d failed (kept original)",
-        resolved_count,
+        "URL resolution: %d resolved (%d cached, %d decoded locally), "
+        "%d failed (kept original)",
+        len(resolved_map),
+        cached_count,
+        tier1_count,
         failed_count,
     )
-    return articles
+    return resolved_map
+
+
+def _gnews_payload(url: str) -> str | None:
+    """Return the encoded article payload of a Google News URL, else None.
+
+    The query string (e.g. ?oc=5) is dropped from the payload.
+    """
+    if not url.startswith(_GNEWS_PREFIXES):
+        return None
+    payload = url.partition("/rss/articles/")[2]
+    if not payload:
+        return None
+    if (query_start := payload.find("?")) != -1:
+        payload = payload[:query_start]
+    return payload
 
 
 def _decode_gnews_url(encoded_payload: str) -> str | None:
@@ -87,19 +139,26 @@ def _decode_gnews_url(encoded_payload: str) -> str | None:
         padded = encoded_payload + "=" * (-len(encoded_payload) % 4)
         raw_bytes = base64.urlsafe_b64decode(padded)
 
-        # Decode as latin-1 to preserve all byte values for regex matching
-        decoded_str = raw_bytes.decode("latin-1")
-
-        # Find URL pattern in decoded bytes
-        url_match = re.search(r"https?://[^\s\x00-\x1f\"<>]+", decoded_str)
+        # Locate candidates with a plain byte search and only run the pattern
+        # anchored there, instead of scanning every offset with search()
+        url_match = None
+        start = raw_bytes.find(b"http")
+        while start != -1:
+            url_match = _EMBEDDED_URL_PATTERN.match(raw_bytes, start)
+            if url_match:
+                break
+            start = raw_bytes.find(b"http", start + 4)
+
+        # Only the match is decoded
         if url_match:
-            candidate = url_match.group(0)
+            candidate = url_match.group(0).decode("ascii")
             if "news.google.com" not in candidate:
                 parsed = urlparse(candidate)
                 if parsed.scheme and parsed.netloc:
                     return candidate
     except Exception as e:
-        logger.debug("Base64 decode failed: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Base64 decode failed: %s", e)
 
     return None
 
@@ -113,6 +172,7 @@ def _resolve_via_decoder(url: str) -> str | None:
             if "news.google.com" not in decoded:
                 return decoded
     except Exception as e:
-        logger.debug("gnewsdecoder failed for %s: %s", url[:60], e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("gnewsdecoder failed for %s: %s", url[:60], e)
 
     return None
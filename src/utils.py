@@ -1,11 +1,19 @@
-"""Shared utilities: retry decorator with exponential backoff."""
+"""Shared utilities: retry decorator with exponential backoff, HTTP/2 detection."""
 
+import asyncio
 import functools
+import importlib.util
+import inspect
 import logging
+import random
 import time
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexes concurrent requests over one TLS connection; it needs
+# the optional h2 package, so httpx clients fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -13,9 +21,55 @@ def retry_with_backoff(
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,),
 ):
-    """Decorator: retry on specified exceptions with exponential backoff."""
+    """Decorator: retry on specified exceptions with jittered exponential backoff.
+
+    Works on both regular functions and coroutine functions; coroutines
+    back off with asyncio.sleep so other tasks keep running.
+    """
+
+    # Backoff schedule is fixed per decoration, so compute it once
+    delays = [base_delay * (backoff_factor**i) for i in range(max_retries - 1)]
 
     def decorator(func):
+        def on_failure(attempt: int, e: Exception) -> float | None:
+            """Log a failed attempt; return the delay before the next one."""
+            if attempt < max_retries - 1:
+                # Jitter to 50-150% so concurrent callers don't retry in lockstep
+                delay = delays[attempt] * (0.5 + random.random())
+                logger.warning(
+                    "Attempt %d/%d for %s failed: %s. Retrying in %.1fs",
+                    attempt + 1,
+                    max_retries,
+                    func.__name__,
+                    e,
+                    delay,
+                )
+                return delay
+            logger.error(
+                "All %d attempts for %s failed: %s",
+                max_retries,
+                func.__name__,
+                e,
+            )
+            return None
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        delay = on_failure(attempt, e)
+                        if delay is not None:
+                            await asyncio.sleep(delay)
+                raise last_exception
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
@@ -24,24 +78,9 @@ def retry_with_backoff(
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (backoff_factor**attempt)
-                        logger.warning(
-                            "Attempt %d/%d for %s failed: %s. Retrying in %.1fs",
-                            attempt + 1,
-                            max_retries,
-                            func.__name__,
-                            e,
-                            delay,
-                        )
+                    delay = on_failure(attempt, e)
+                    if delay is not None:
                         time.sleep(delay)
-                    else:
-                        logger.error(
-                            "All %d attempts for %s failed: %s",
-                            max_retries,
-                            func.__name__,
-                            e,
-                        )
             raise last_exception
 
         return wrapper